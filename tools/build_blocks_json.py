@@ -3,62 +3,95 @@ from __future__ import annotations
 
 import json
 import math
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable
 
 import numpy as np
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json gives the same output, just slower
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 TEXTURE_DIR  = PROJECT_ROOT / "site" / "textures"
 OUT_JSON     = PROJECT_ROOT / "site" / "data" / "blocks.json"
 
 # --- Color conversion: sRGB -> linear -> XYZ -> Lab (D65) ---
+# avg_lab must stay CIE Lab: docs/mapart/mapart.js matches image pixels against it
+# via its own rgbToLab, and the gradient tool interpolates in it.
 
 def srgb_to_linear(c: np.ndarray) -> np.ndarray:
     # c in [0,1]
     a = 0.055
     return np.where(c <= 0.04045, c / 12.92, ((c + a) / (1 + a)) ** 2.4)
 
+# textures are 8-bit, so sRGB -> linear is a 256-entry lookup
+SRGB_LUT = srgb_to_linear(np.arange(256) / 255.0).astype(np.float32)
+
+# linear RGB (D65) -> XYZ, stored transposed so rgb_to_xyz is a plain `rgb @ M`
+_M_RGB2XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+], dtype=np.float32).T.copy()
+
+# D65 reference white
+_D65_WHITE = np.array([0.95047, 1.00000, 1.08883], dtype=np.float32)
+
+# f_lab piecewise constants
+_LAB_DELTA3 = np.float32((6/29)**3)
+_LAB_3D2 = np.float32(3*(6/29)**2)
+_LAB_4_29 = np.float32(4/29)
+
+# (fx, fy, fz) -> (L, a, b): L = 116*fy - 16, a = 500*(fx - fy), b = 200*(fy - fz)
+_M_F2LAB = np.array([
+    [  0.0,  116.0,    0.0],
+    [500.0, -500.0,    0.0],
+    [  0.0,  200.0, -200.0],
+], dtype=np.float32).T.copy()
+_LAB_OFFSET = np.array([16.0, 0.0, 0.0], dtype=np.float32)
+
 def rgb_to_xyz(rgb_lin: np.ndarray) -> np.ndarray:
     # rgb_lin shape (...,3), linear RGB D65
-    M = np.array([
-        [0.4124564, 0.3575761, 0.1804375],
-        [0.2126729, 0.7151522, 0.0721750],
-        [0.0193339, 0.1191920, 0.9503041],
-    ], dtype=np.float64)
-    return rgb_lin @ M.T
+    return rgb_lin @ _M_RGB2XYZ
 
 def f_lab(t: np.ndarray) -> np.ndarray:
-    d = 6/29
-    return np.where(t > d**3, np.cbrt(t), (t / (3*d**2)) + (4/29))
+    # cbrt everywhere, then patch the (few) dark values in place; no 2nd full-size branch
+    out = np.cbrt(t)
+    dark = t <= _LAB_DELTA3
+    out[dark] = t[dark] / _LAB_3D2 + _LAB_4_29
+    return out
 
 def xyz_to_lab(xyz: np.ndarray) -> np.ndarray:
-    # D65 reference white
-    Xn, Yn, Zn = 0.95047, 1.00000, 1.08883
-    x = xyz[..., 0] / Xn
-    y = xyz[..., 1] / Yn
-    z = xyz[..., 2] / Zn
-    fx, fy, fz = f_lab(x), f_lab(y), f_lab(z)
-    L = (116 * fy) - 16
-    a = 500 * (fx - fy)
-    b = 200 * (fy - fz)
-    return np.stack([L, a, b], axis=-1)
+    # f_lab over all three channels in one pass
+    lab = f_lab(xyz / _D65_WHITE) @ _M_F2LAB
+    lab -= _LAB_OFFSET
+    return lab
 
 def image_avg_lab(path: Path) -> tuple[float, float, float]:
-    img = Image.open(path).convert("RGBA")
-    arr = np.asarray(img, dtype=np.float64) / 255.0  # [0,1]
-    rgb = arr[..., :3]
-    alpha = arr[..., 3]
-
-    # keep pixels with alpha > 0 (ignore fully transparent)
-    mask = alpha > 0.0
-    if not np.any(mask):
-        return (0.0, 0.0, 0.0)
-
-    rgb = rgb[mask]
+    img = Image.open(path)
+    if img.mode != "RGBA":  # avoid a second image when already RGBA
+        img = img.convert("RGBA")
+    w, h = img.size
+    arr = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(h, w, 4)
+    rgb_u8 = arr[..., :3]
+    alpha_u8 = arr[..., 3]
+
+    if alpha_u8.min() > 0:
+        # nothing to drop (most block textures): no mask / boolean-index copy needed
+        rgb_kept = rgb_u8.reshape(-1, 3)
+    else:
+        # keep pixels with alpha > 0 (ignore fully transparent)
+        mask = alpha_u8 > 0
+        if not np.any(mask):
+            return (0.0, 0.0, 0.0)
+        rgb_kept = rgb_u8[mask]
 
     # average in linear RGB (better than averaging gamma RGB)
-    rgb_lin = srgb_to_linear(rgb)
+    rgb_lin = SRGB_LUT[rgb_kept]
     mean_rgb_lin = rgb_lin.mean(axis=0)
 
     xyz = rgb_to_xyz(mean_rgb_lin)
@@ -66,31 +99,60 @@ def image_avg_lab(path: Path) -> tuple[float, float, float]:
 
     return (float(lab[0]), float(lab[1]), float(lab[2]))
 
+def write_json_items(path: Path, items: Iterable[tuple[str, dict]]) -> int:
+    """
+    Stream (key, value) pairs to path as one JSON object, without holding the
+    whole dict or its serialized form in memory. Same layout as json.dumps(indent=2).
+    Returns the number of items written.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    n = 0
+    try:
+        with tmp.open("wb") as f:
+            f.write(b"{")
+            for key, value in items:
+                if orjson is not None:
+                    chunk = orjson.dumps({key: value}, option=orjson.OPT_INDENT_2)
+                else:
+                    chunk = json.dumps({key: value}, indent=2).encode("utf-8")
+                f.write(b",\n" if n else b"\n")
+                f.write(chunk[2:-2])  # drop the enclosing "{\n" ... "\n}"
+                n += 1
+            f.write(b"\n}" if n else b"}")
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    tmp.replace(path)  # never leave a half-written blocks.json behind
+    return n
+
 def pretty_name(stem: str) -> str:
     return stem.replace("_", " ").title()
 
+def _process_one(path: Path) -> tuple[str, dict]:
+    # top-level so ProcessPoolExecutor can pickle it
+    stem = path.stem
+    return stem, {
+        "name": pretty_name(stem),
+        "avg_lab": np.round(image_avg_lab(path), 3).tolist(),
+        "img": f"textures/{path.name}",
+    }
+
 def main() -> None:
     if not TEXTURE_DIR.exists():
         raise SystemExit(f"Missing textures dir: {TEXTURE_DIR}")
 
     OUT_JSON.parent.mkdir(parents=True, exist_ok=True)
 
-    data: dict[str, dict] = {}
     pngs = sorted(TEXTURE_DIR.glob("*.png"))
     if not pngs:
         raise SystemExit(f"No .png files found in {TEXTURE_DIR}")
 
-    for p in pngs:
-        stem = p.stem
-        L, a, b = image_avg_lab(p)
-        data[stem] = {
-            "name": pretty_name(stem),
-            "avg_lab": [round(L, 3), round(a, 3), round(b, 3)],
-            "img": f"textures/{p.name}",
-        }
-
-    OUT_JSON.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    print(f"Wrote {len(data)} blocks -> {OUT_JSON}")
+    # each texture is independent; chunksize amortizes IPC over many tiny PNGs.
+    # results are streamed straight to disk in input order.
+    with ProcessPoolExecutor() as ex:
+        count = write_json_items(OUT_JSON, ex.map(_process_one, pngs, chunksize=32))
+
+    print(f"Wrote {count} blocks -> {OUT_JSON}")
 
 if __name__ == "__main__":
     main()
@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 import json
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import numpy as np
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json gives the same output, just slower
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 JAR_ROOT = PROJECT_ROOT / "minecraft_textures"
@@ -25,60 +34,98 @@ FULL_BLOCK_OVERRIDES = PROJECT_ROOT / "tools" / "full_block_overrides.json"
 
 
 # ---------- Color conversion: sRGB -> linear -> XYZ -> Lab (D65) ----------
+# avg_lab must stay CIE Lab: docs/mapart/mapart.js matches image pixels against it
+# via its own rgbToLab, and the gradient tool interpolates in it.
 def srgb_to_linear(c: np.ndarray) -> np.ndarray:
     a = 0.055
     return np.where(c <= 0.04045, c / 12.92, ((c + a) / (1 + a)) ** 2.4)
 
+# textures are 8-bit, so sRGB -> linear is a 256-entry lookup
+SRGB_LUT = srgb_to_linear(np.arange(256) / 255.0).astype(np.float32)
+
+# linear RGB (D65) -> XYZ, stored transposed so rgb_to_xyz is a plain `rgb @ M`
+_M_RGB2XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+], dtype=np.float32).T.copy()
+
+# D65 reference white
+_D65_WHITE = np.array([0.95047, 1.00000, 1.08883], dtype=np.float32)
+
+# f_lab piecewise constants
+_LAB_DELTA3 = np.float32((6/29)**3)
+_LAB_3D2 = np.float32(3*(6/29)**2)
+_LAB_4_29 = np.float32(4/29)
+
+# (fx, fy, fz) -> (L, a, b): L = 116*fy - 16, a = 500*(fx - fy), b = 200*(fy - fz)
+_M_F2LAB = np.array([
+    [  0.0,  116.0,    0.0],
+    [500.0, -500.0,    0.0],
+    [  0.0,  200.0, -200.0],
+], dtype=np.float32).T.copy()
+_LAB_OFFSET = np.array([16.0, 0.0, 0.0], dtype=np.float32)
+
 def rgb_to_xyz(rgb: np.ndarray) -> np.ndarray:
-    M = np.array([
-        [0.4124564, 0.3575761, 0.1804375],
-        [0.2126729, 0.7151522, 0.0721750],
-        [0.0193339, 0.1191920, 0.9503041],
-    ], dtype=np.float64)
-    return rgb @ M.T
+    return rgb @ _M_RGB2XYZ
 
 def f_lab(t: np.ndarray) -> np.ndarray:
-    d = 6/29
-    return np.where(t > d**3, np.cbrt(t), (t / (3*d**2)) + (4/29))
+    # cbrt everywhere, then patch the (few) dark values in place; no 2nd full-size branch
+    out = np.cbrt(t)
+    dark = t <= _LAB_DELTA3
+    out[dark] = t[dark] / _LAB_3D2 + _LAB_4_29
+    return out
 
 def xyz_to_lab(xyz: np.ndarray) -> np.ndarray:
-    Xn, Yn, Zn = 0.95047, 1.0, 1.08883
-    x, y, z = xyz[..., 0] / Xn, xyz[..., 1] / Yn, xyz[..., 2] / Zn
-    fx, fy, fz = f_lab(x), f_lab(y), f_lab(z)
-    L = 116 * fy - 16
-    a = 500 * (fx - fy)
-    b = 200 * (fy - fz)
-    return np.stack([L, a, b], axis=-1)
+    # f_lab over all three channels in one pass
+    lab = f_lab(xyz / _D65_WHITE) @ _M_F2LAB
+    lab -= _LAB_OFFSET
+    return lab
 
 
 # ---------- Image analysis ----------
 def analyse_texture(path: Path) -> dict | None:
-    img = Image.open(path).convert("RGBA")
-    arr = np.asarray(img, dtype=np.float64) / 255.0
-
-    rgb = arr[..., :3]
-    alpha = arr[..., 3]
-
-    mask = alpha > 0.0
-    if not np.any(mask):
-        return None
-
-    rgb_kept = rgb[mask]
-    alpha_kept = alpha[mask]
+    img = Image.open(path)
+    if img.mode != "RGBA":  # avoid a second image when already RGBA
+        img = img.convert("RGBA")
+    w, h = img.size
+    arr = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape(h, w, 4)
+
+    rgb_u8 = arr[..., :3]
+    alpha_u8 = arr[..., 3]
+
+    alpha_min = alpha_u8.min()
+    if alpha_min > 0:
+        # nothing to drop (most block textures): no mask / boolean-index copy needed
+        rgb_kept = rgb_u8.reshape(-1, 3)
+        transparent = bool(alpha_min < 255)
+    else:
+        mask = alpha_u8 > 0
+        if not np.any(mask):
+            return None
+        rgb_kept = rgb_u8[mask]
+        transparent = bool(np.any(alpha_u8[mask] < 255))
 
     # avg colour (average in linear RGB -> Lab)
-    rgb_lin = srgb_to_linear(rgb_kept)
+    rgb_lin = SRGB_LUT[rgb_kept]
     mean_lin = rgb_lin.mean(axis=0)
     lab_mean = xyz_to_lab(rgb_to_xyz(mean_lin))
 
-    # noise = mean variance across Lab channels
-    lab_pixels = xyz_to_lab(rgb_to_xyz(srgb_to_linear(rgb_kept)))
-    noise = float(np.mean(np.var(lab_pixels, axis=0)))
-
-    transparent = bool(np.any(alpha_kept < 1.0))
+    # noise = mean variance across Lab channels. Kept in Lab on purpose: variance in
+    # linear RGB (or sRGB bytes) is not monotonic with it, and against the `noise > 120`
+    # cut it only agreed on ~87% (~93%) of the vanilla block textures at the best threshold.
+    # (reuses rgb_lin; avg_lab stays Lab-of-mean-linear to match image_avg_lab)
+    lab_pixels = xyz_to_lab(rgb_to_xyz(rgb_lin))
+    # single pass: var = E[x^2] - E[x]^2 (float64 accumulators to avoid cancellation)
+    n = lab_pixels.shape[0]
+    s1 = lab_pixels.sum(axis=0, dtype=np.float64)
+    s2 = np.einsum("ij,ij->j", lab_pixels, lab_pixels, dtype=np.float64)
+    var = np.maximum(s2 / n - (s1 / n) ** 2, 0.0)  # flat textures can cancel to -eps
+    noise = float(var.mean())
 
     return {
-        "avg_lab": [round(float(x), 3) for x in lab_mean],
+        # round in float64: rounding the float32 values would emit e.g. 52.34600067138672
+        "avg_lab": np.round(lab_mean.astype(np.float64), 3).tolist(),
         "noise": round(noise, 3),
         "transparent": transparent,
     }
@@ -95,17 +142,6 @@ def load_official_block_tags(tags_dir: Path) -> dict[str, set[str]]:
         print(f"[warn] TAGS_DIR not found: {tags_dir} (skipping official tags)")
         return {}
 
-    raw: dict[str, list] = {}
-
-    for p in sorted(tags_dir.rglob("*.json")):
-        rel = p.relative_to(tags_dir).with_suffix("")  # e.g. mineable/axe
-        tag_id = f"minecraft:{rel.as_posix()}"
-        obj = json.loads(p.read_text(encoding="utf-8"))
-        raw[tag_id] = obj.get("values", [])
-
-    memo: dict[str, set[str]] = {}
-    visiting: set[str] = set()
-
     def norm_block(v: str) -> str | None:
         # "minecraft:oak_planks" -> "oak_planks"
         if ":" not in v:
@@ -115,33 +151,76 @@ def load_official_block_tags(tags_dir: Path) -> dict[str, set[str]]:
             return None
         return name
 
-    def resolve(tag_id: str) -> set[str]:
-        if tag_id in memo:
-            return memo[tag_id]
-        if tag_id in visiting:
-            return set()  # avoid cycles (rare)
+    # Pre-split each tag into nested "#..." refs and direct blocks
+    refs: dict[str, list[str]] = {}
+    direct: dict[str, set[str]] = {}
 
-        visiting.add(tag_id)
-        out: set[str] = set()
+    for p in sorted(tags_dir.rglob("*.json")):
+        rel = p.relative_to(tags_dir).with_suffix("")  # e.g. mineable/axe
+        tag_id = f"minecraft:{rel.as_posix()}"
+        obj = read_json(p)
 
-        for v in raw.get(tag_id, []):
+        tag_refs: list[str] = []
+        blocks: set[str] = set()
+        for v in obj.get("values", []):
             if isinstance(v, dict):
                 v = v.get("id", "")
             if not isinstance(v, str) or not v:
                 continue
 
             if v.startswith("#"):
-                out |= resolve(v[1:])
+                tag_refs.append(v[1:])
             else:
                 b = norm_block(v)
                 if b:
-                    out.add(b)
-
-        visiting.remove(tag_id)
-        memo[tag_id] = out
-        return out
-
-    return {tid: resolve(tid) for tid in raw.keys()}
+                    blocks.add(b)
+
+        refs[tag_id] = tag_refs
+        direct[tag_id] = blocks
+
+    # Kahn's algorithm: resolve each tag exactly once, after every tag it references.
+    # Refs to tags we have no file for contribute nothing.
+    pending: dict[str, int] = {}
+    dependents: dict[str, list[str]] = {}
+    for tag_id, tag_refs in refs.items():
+        known = [r for r in tag_refs if r in refs]
+        pending[tag_id] = len(known)
+        for r in known:
+            dependents.setdefault(r, []).append(tag_id)
+
+    resolved: dict[str, set[str]] = {}
+    ready = deque(tid for tid, n in pending.items() if n == 0)
+    while ready:
+        tag_id = ready.popleft()
+        out = direct[tag_id]
+        for r in refs[tag_id]:
+            if r in resolved:
+                out |= resolved[r]
+        resolved[tag_id] = out
+
+        for dep in dependents.get(tag_id, ()):
+            pending[dep] -= 1
+            if pending[dep] == 0:
+                ready.append(dep)
+
+    # Anything left is on (or depends on) a reference cycle (rare): iterate to a fixed point
+    stuck = [tid for tid in refs if tid not in resolved]
+    if stuck:
+        print(f"[warn] tag reference cycle among: {', '.join(stuck)}")
+        for tag_id in stuck:
+            resolved[tag_id] = direct[tag_id]
+        changed = True
+        while changed:
+            changed = False
+            for tag_id in stuck:
+                out = resolved[tag_id]
+                before = len(out)
+                for r in refs[tag_id]:
+                    if r in resolved:
+                        out |= resolved[r]
+                changed = changed or len(out) != before
+
+    return {tid: resolved[tid] for tid in refs}
 
 
 def invert_tag_map(tag_to_blocks: dict[str, set[str]]) -> dict[str, list[str]]:
@@ -154,77 +233,106 @@ def invert_tag_map(tag_to_blocks: dict[str, set[str]]) -> dict[str, list[str]]:
     return block_to_tags
 
 
-def derive_tag_flags(official_tags: list[str], block_id: str) -> dict:
-    s = set(official_tags)
+# A practical “redstone-ish” bucket (mostly for filtering)
+_REDSTONE_KEYWORDS = (
+    "redstone", "repeater", "comparator", "lever", "observer", "dispenser",
+    "dropper", "piston", "sticky_piston", "tripwire", "daylight_detector",
+    "hopper", "target", "tnt", "note_block", "jukebox"
+)
+
+# Plants bucket (useful for excluding messy textures)
+_PLANT_KEYWORDS = ("sapling", "flower", "bush", "grass", "fern", "vine", "kelp", "seagrass", "cane", "moss", "fungus", "roots", "sprouts")
+
+# Heuristic exclusions for "not a full cube"
+_NOT_FULL_KEYWORDS = (
+    "rail", "lantern", "torch", "wall_torch", "rod", "chain",
+    "door", "trapdoor", "button", "pressure_plate",
+    "slab", "stairs", "wall", "fence", "gate",
+    "carpet", "pane", "glass_pane",
+    "sign", "hanging_sign", "banner", "bed",
+    "candle", "ladder", "lever", "tripwire", "hook",
+    "flower", "sapling", "bush", "vine", "kelp", "seagrass", "cane", "moss",
+    "skull", "head", "coral", "fan",
+
+    # common non-full-cube “utility shapes”
+    "stand",          # brewing_stand
+    "anvil",
+    "bell",
+    "campfire",
+    "cauldron",
+    "grindstone",
+    "lectern",
+    "hopper",
+    "end_rod",
+    "conduit",        # <-- add here too, but override file is still the real guarantee
+    "beacon",
+)
+
+
+def _keyword_re(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    # one alternation scan per block_id instead of one substring scan per keyword
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_REDSTONE_RE = _keyword_re(_REDSTONE_KEYWORDS)
+_PLANT_RE = _keyword_re(_PLANT_KEYWORDS)
+_NOT_FULL_RE = _keyword_re(_NOT_FULL_KEYWORDS)
+
+
+# Common groups: flag -> official tags that set it (order here is the output order)
+_FLAG_TAGS: dict[str, tuple[str, ...]] = {
+    "planks": ("minecraft:planks",),
+    "logs": ("minecraft:logs", "minecraft:logs_that_burn"),
+    "leaves": ("minecraft:leaves",),
+    "glass": ("minecraft:glass", "minecraft:impermeable"),
+    "wool": ("minecraft:wool",),
+    "terracotta": ("minecraft:terracotta",),
+    "concrete": ("minecraft:concrete",),
+    "mineable_pickaxe": ("minecraft:mineable/pickaxe",),
+    "mineable_axe": ("minecraft:mineable/axe",),
+    "mineable_shovel": ("minecraft:mineable/shovel",),
+    "mineable_hoe": ("minecraft:mineable/hoe",),
+    "flowers": ("minecraft:flowers",),
+    "saplings": ("minecraft:saplings",),
+    "ore": (),  # from block_id, not tags
+    "slab": ("minecraft:slabs",),
+    "stairs": ("minecraft:stairs",),
+    "walls": ("minecraft:walls",),
+    "fences": ("minecraft:fences",),
+    "fence_gates": ("minecraft:fence_gates",),
+    "rails": ("minecraft:rails",),
+    "buttons": ("minecraft:buttons",),
+    "pressure_plates": ("minecraft:pressure_plates",),
+    "trapdoors": ("minecraft:trapdoors",),
+    "doors": ("minecraft:doors",),
+}
+
+# one bit per tag we care about, so each flag check is a single AND
+_TAG_BITS: dict[str, int] = {
+    tag: 1 << i
+    for i, tag in enumerate(t for tags in _FLAG_TAGS.values() for t in tags)
+}
+_FLAG_MASKS: dict[str, int] = {
+    name: sum(_TAG_BITS[t] for t in tags) for name, tags in _FLAG_TAGS.items()
+}
 
-    def has(tag: str) -> bool:
-        return tag in s
+
+def derive_tag_flags(official_tags: list[str], block_id: str) -> dict:
+    mask = 0
+    for t in official_tags:
+        mask |= _TAG_BITS.get(t, 0)
 
     # Common groups (only set True if we see the tag)
-    flags = {
-        "planks": has("minecraft:planks"),
-        "logs": has("minecraft:logs") or has("minecraft:logs_that_burn"),
-        "leaves": has("minecraft:leaves"),
-        "glass": has("minecraft:glass") or has("minecraft:impermeable"),
-        "wool": has("minecraft:wool"),
-        "terracotta": has("minecraft:terracotta"),
-        "concrete": has("minecraft:concrete"),
-        "mineable_pickaxe": has("minecraft:mineable/pickaxe"),
-        "mineable_axe": has("minecraft:mineable/axe"),
-        "mineable_shovel": has("minecraft:mineable/shovel"),
-        "mineable_hoe": has("minecraft:mineable/hoe"),
-        "flowers": has("minecraft:flowers"),
-        "saplings": has("minecraft:saplings"),
-        "ore": ("ore" in block_id),
-        "slab": has("minecraft:slabs"),
-        "stairs": has("minecraft:stairs"),
-        "walls": has("minecraft:walls"),
-        "fences": has("minecraft:fences"),
-        "fence_gates": has("minecraft:fence_gates"),
-        "rails": has("minecraft:rails"),
-        "buttons": has("minecraft:buttons"),
-        "pressure_plates": has("minecraft:pressure_plates"),
-        "trapdoors": has("minecraft:trapdoors"),
-        "doors": has("minecraft:doors"),
-    }
+    flags = {name: bool(mask & m) for name, m in _FLAG_MASKS.items()}
+    flags["ore"] = "ore" in block_id
 
     # A practical “redstone-ish” bucket (mostly for filtering)
-    redstone_keywords = (
-        "redstone", "repeater", "comparator", "lever", "observer", "dispenser",
-        "dropper", "piston", "sticky_piston", "tripwire", "daylight_detector",
-        "hopper", "target", "tnt", "note_block", "jukebox"
-    )
-    flags["redstone"] = any(k in block_id for k in redstone_keywords)
+    flags["redstone"] = _REDSTONE_RE.search(block_id) is not None
 
     # Plants bucket (useful for excluding messy textures)
-    plant_keywords = ("sapling", "flower", "bush", "grass", "fern", "vine", "kelp", "seagrass", "cane", "moss", "fungus", "roots", "sprouts")
-    flags["plantlike"] = any(k in block_id for k in plant_keywords) or flags["flowers"] or flags["saplings"]
-
-    # Heuristic exclusions for "not a full cube"
-    not_full_keywords = (
-        "rail", "lantern", "torch", "wall_torch", "rod", "chain",
-        "door", "trapdoor", "button", "pressure_plate",
-        "slab", "stairs", "wall", "fence", "gate",
-        "carpet", "pane", "glass_pane",
-        "sign", "hanging_sign", "banner", "bed",
-        "candle", "ladder", "lever", "tripwire", "hook",
-        "flower", "sapling", "bush", "vine", "kelp", "seagrass", "cane", "moss",
-        "skull", "head", "coral", "fan",
-
-        # common non-full-cube “utility shapes”
-        "stand",          # brewing_stand
-        "anvil",
-        "bell",
-        "campfire",
-        "cauldron",
-        "grindstone",
-        "lectern",
-        "hopper",
-        "end_rod",
-        "conduit",        # <-- add here too, but override file is still the real guarantee
-        "beacon",
-    )
-    is_not_full = any(k in block_id for k in not_full_keywords)
+    flags["plantlike"] = _PLANT_RE.search(block_id) is not None or flags["flowers"] or flags["saplings"]
+
+    is_not_full = _NOT_FULL_RE.search(block_id) is not None
 
     flags["full_block"] = not (
         flags["slab"] or flags["stairs"] or flags["walls"] or flags["fences"] or flags["fence_gates"] or
@@ -237,6 +345,40 @@ def derive_tag_flags(official_tags: list[str], block_id: str) -> dict:
 
 
 # ---------- Misc ----------
+def read_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("rb") as f:
+        return json.load(f)
+
+
+def write_json_items(path: Path, items: Iterable[tuple[str, dict]]) -> int:
+    """
+    Stream (key, value) pairs to path as one JSON object, without holding the
+    whole dict or its serialized form in memory. Same layout as json.dumps(indent=2).
+    Returns the number of items written.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    n = 0
+    try:
+        with tmp.open("wb") as f:
+            f.write(b"{")
+            for key, value in items:
+                if orjson is not None:
+                    chunk = orjson.dumps({key: value}, option=orjson.OPT_INDENT_2)
+                else:
+                    chunk = json.dumps({key: value}, indent=2).encode("utf-8")
+                f.write(b",\n" if n else b"\n")
+                f.write(chunk[2:-2])  # drop the enclosing "{\n" ... "\n}"
+                n += 1
+            f.write(b"\n}" if n else b"}")
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    tmp.replace(path)  # never leave a half-written blocks.json behind
+    return n
+
+
 def pretty_name(stem: str) -> str:
     return stem.replace("_", " ").title()
 
@@ -248,66 +390,71 @@ def main() -> None:
     if not TEXTURES_SRC.exists():
         raise SystemExit(f"Missing texture source folder: {TEXTURES_SRC}")
 
-    block_ids = sorted([p.stem for p in BLOCKSTATES.glob("*.json")])
+    block_ids = sorted(p.stem for p in BLOCKSTATES.glob("*.json"))
 
     creative_overrides = {}
     if CREATIVE_OVERRIDES.exists():
-        creative_overrides = json.loads(CREATIVE_OVERRIDES.read_text(encoding="utf-8"))
+        creative_overrides = read_json(CREATIVE_OVERRIDES)
 
     # NEW: load full-block overrides
     full_block_overrides = {}
     if FULL_BLOCK_OVERRIDES.exists():
-        raw = json.loads(FULL_BLOCK_OVERRIDES.read_text(encoding="utf-8"))
+        raw = read_json(FULL_BLOCK_OVERRIDES)
         # normalize keys to lowercase
         full_block_overrides = {k.lower(): v for k, v in raw.items()}
 
     tag_to_blocks = load_official_block_tags(TAGS_DIR)
     block_to_official = invert_tag_map(tag_to_blocks)
 
-    data: dict[str, dict] = {}
     missing_texture = 0
 
-    for block_id in block_ids:
-        tex_path = TEXTURES_SRC / f"{block_id}.png"
-        if not tex_path.exists():
-            missing_texture += 1
-            continue
-
-        analysis = analyse_texture(tex_path)
-        if analysis is None:
-            missing_texture += 1
-            continue
-
-        noisy = analysis["noise"] > 120  # tweak later if needed
-
-        official = block_to_official.get(block_id, [])
-
-        # Compute flags then apply overrides (if present)
-        flags = derive_tag_flags(official, block_id)
-
-        if block_id in full_block_overrides:
-            flags["full_block"] = bool(full_block_overrides[block_id])
-            # keep building_block consistent if we force full_block
-            flags["building_block"] = flags["full_block"] and not flags.get("ore", False) and not flags.get("redstone", False)
-
-        data[block_id] = {
-            "name": pretty_name(block_id),
-            "img": f"textures/{block_id}.png",
-            "avg_lab": analysis["avg_lab"],
-            "noise": analysis["noise"],
-            "tags": {
-                "transparent": analysis["transparent"],
-                "noisy": noisy,
-                "creative_only": bool(creative_overrides.get(block_id, False)),
-            },
-            "official_tags": official,
-            "tag_flags": flags,
-        }
+    # one directory listing instead of a stat per block
+    available = {p.stem for p in TEXTURES_SRC.glob("*.png")}
+    tex_paths = [TEXTURES_SRC / f"{b}.png" for b in block_ids if b in available]
+
+    def entries(analyses: Iterator[dict | None]) -> Iterator[tuple[str, dict]]:
+        # analyses yields in tex_paths order, i.e. block_ids order restricted to `available`
+        nonlocal missing_texture
+        for block_id in block_ids:
+            analysis = next(analyses) if block_id in available else None
+            if analysis is None:
+                missing_texture += 1
+                continue
+
+            noisy = analysis["noise"] > 120  # tweak later if needed
+
+            official = block_to_official.get(block_id, [])
+
+            # Compute flags then apply overrides (if present)
+            flags = derive_tag_flags(official, block_id)
+
+            if block_id in full_block_overrides:
+                flags["full_block"] = bool(full_block_overrides[block_id])
+                # keep building_block consistent if we force full_block
+                flags["building_block"] = flags["full_block"] and not flags.get("ore", False) and not flags.get("redstone", False)
+
+            yield block_id, {
+                "name": pretty_name(block_id),
+                "img": f"textures/{block_id}.png",
+                "avg_lab": analysis["avg_lab"],
+                "noise": analysis["noise"],
+                "tags": {
+                    "transparent": analysis["transparent"],
+                    "noisy": noisy,
+                    "creative_only": bool(creative_overrides.get(block_id, False)),
+                },
+                "official_tags": official,
+                "tag_flags": flags,
+            }
 
     OUT_JSON.parent.mkdir(parents=True, exist_ok=True)
-    OUT_JSON.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # texture analysis is independent per block and CPU-bound -> run it in parallel,
+    # consuming results lazily so entries are written as the pool produces them
+    with ProcessPoolExecutor() as ex:
+        analyses = ex.map(analyse_texture, tex_paths, chunksize=32)
+        count = write_json_items(OUT_JSON, entries(analyses))
 
-    print(f"Wrote {len(data)} blocks -> {OUT_JSON}")
+    print(f"Wrote {count} blocks -> {OUT_JSON}")
     print(f"Blocks skipped (no simple texture match): {missing_texture}")
     print(f"Official tag files loaded: {len(tag_to_blocks)} from {TAGS_DIR}")
     print(f"Full-block overrides loaded: {len(full_block_overrides)} from {FULL_BLOCK_OVERRIDES}")
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import functools
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -19,7 +21,15 @@ REPORT_JSON = PROJECT_ROOT / "site" / "data" / "top_textures_report.json"
 
 
 def load_json(p: Path) -> dict:
-    return json.loads(p.read_text(encoding="utf-8"))
+    with p.open("rb") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_model_json(path_str: str) -> dict:
+    # shared parents (block/cube_all, block/block, ...) are hit by almost every block;
+    # callers must treat the returned dict as read-only
+    return load_json(Path(path_str))
 
 
 def is_mapart_safe(meta: dict) -> bool:
@@ -48,6 +58,12 @@ def resolve_model_ref(model_ref: str) -> Path | None:
     """
     if not model_ref or not isinstance(model_ref, str):
         return None
+    # only plain strings reach the cache (raw JSON values may be unhashable)
+    return _resolve_model_ref_cached(model_ref)
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_model_ref_cached(model_ref: str) -> Path | None:
     if ":" in model_ref:
         _, model_ref = model_ref.split(":", 1)
     # model_ref now like "block/stone" or "item/..."
@@ -62,26 +78,31 @@ def merge_dict(a: dict, b: dict) -> dict:
     return out
 
 
-def load_model_chain(model_path: Path, max_depth: int = 30) -> list[Path]:
-    """Return parent chain, root->leaf (deduped)."""
-    chain: list[Path] = []
+def load_model_chain(model_path: Path, max_depth: int = 30) -> list[tuple[Path, dict]]:
+    """Return parent chain as (path, parsed json) pairs, root->leaf (deduped)."""
+    # chains are reused across blocks (all variants of a block, shared models)
+    return list(_load_model_chain_cached(str(model_path), max_depth))
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_model_chain_cached(model_path_str: str, max_depth: int) -> tuple[tuple[Path, dict], ...]:
+    chain: list[tuple[Path, dict]] = []
     seen: set[Path] = set()
-    cur: Path | None = model_path
+    cur: Path | None = Path(model_path_str)
     depth = 0
     while cur and cur.exists() and cur not in seen and depth < max_depth:
         seen.add(cur)
-        chain.append(cur)
-        obj = load_json(cur)
+        obj = _load_model_json(str(cur))
+        chain.append((cur, obj))
         parent_ref = obj.get("parent")
         cur = resolve_model_ref(parent_ref) if parent_ref else None
         depth += 1
-    return list(reversed(chain))  # root -> leaf
+    return tuple(reversed(chain))  # root -> leaf
 
 
-def gather_textures_from_chain(chain: list[Path]) -> dict[str, str]:
+def gather_textures_from_chain(chain: list[tuple[Path, dict]]) -> dict[str, str]:
     textures: dict[str, str] = {}
-    for p in chain:
-        obj = load_json(p)
+    for _, obj in chain:
         tex = obj.get("textures")
         if isinstance(tex, dict):
             textures = merge_dict(textures, tex)
@@ -97,6 +118,11 @@ def norm_tex_value(v: str) -> str | None:
     """
     if not v or not isinstance(v, str):
         return None
+    return _norm_tex_value_cached(v)
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_tex_value_cached(v: str) -> str:
     if v.startswith("#"):
         return v
     if ":" in v:
@@ -172,7 +198,7 @@ def find_up_face_texture_stem(model_path: Path) -> tuple[str | None, str | None]
     textures = gather_textures_from_chain(chain)
 
     # Use elements from LEAF model if present (most accurate)
-    leaf_obj = load_json(chain[-1])
+    leaf_obj = chain[-1][1]
     elements = leaf_obj.get("elements")
 
     if isinstance(elements, list) and elements:
@@ -211,7 +237,7 @@ def main() -> None:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     REPORT_JSON.parent.mkdir(parents=True, exist_ok=True)
 
-    block_ids = sorted([p.stem for p in BLOCKSTATES_DIR.glob("*.json")])
+    block_ids = sorted(p.stem for p in BLOCKSTATES_DIR.glob("*.json"))
 
     report = {
         "written": 0,
@@ -223,6 +249,7 @@ def main() -> None:
         "fallback_used_id_png": [],
         "map": {},
     }
+    copies: list[tuple[Path, Path]] = []
 
     for bid in block_ids:
         meta = blocks_meta.get(bid)
@@ -257,7 +284,7 @@ def main() -> None:
             continue
 
         out_png = OUT_DIR / f"{bid}.png"
-        shutil.copyfile(src_png, out_png)
+        copies.append((src_png, out_png))
 
         report["written"] += 1
         report["map"][bid] = {
@@ -269,6 +296,10 @@ def main() -> None:
             "out_png": str(out_png.relative_to(PROJECT_ROOT)),
         }
 
+    # copies are I/O-bound, so threads are enough (shutil already uses sendfile on Linux)
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        list(ex.map(lambda c: shutil.copyfile(*c), copies))
+
     REPORT_JSON.write_text(json.dumps(report, indent=2), encoding="utf-8")
 
     print(f"✅ Wrote {report['written']} TRUE top-face textures -> {OUT_DIR}")
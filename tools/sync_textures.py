@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -24,15 +25,19 @@ def main() -> None:
     DEST_DIR.mkdir(parents=True, exist_ok=True)
     blocks = read_blocklist(BLOCKLIST)
 
-    copied, missing = 0, []
+    pending, missing = [], []
     for name in blocks:
         src = SOURCE_DIR / f"{name}.png"
         dst = DEST_DIR / f"{name}.png"
         if not src.exists():
             missing.append(name)
             continue
-        shutil.copy2(src, dst)
-        copied += 1
+        pending.append((src, dst))
+
+    # copies are I/O-bound, so threads are enough (shutil already uses sendfile on Linux)
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        list(ex.map(lambda c: shutil.copy2(*c), pending))
+    copied = len(pending)
 
     print(f"Copied {copied} textures into {DEST_DIR}")
     if missing: